@@ -32,11 +32,11 @@ Example usage:
 
 from __future__ import annotations
 
-import copy
 import dataclasses
 import email.message
 import email.policy
 import email.utils
+import functools
 import os
 import os.path
 import pathlib
@@ -87,11 +87,21 @@ def __dir__() -> list[str]:
     return __all__
 
 
+# Extras are normalized following PEP 685.
+_EXTRA_TRANSLATION = str.maketrans("._", "--")
+
+# Characters that require quoting a name in an email address.
+_ADDRESS_SPECIALS = frozenset('()<>@,:;."[]\\')
+
+# Names can be changed after creation, so cache on the name itself.
+_canonicalize_name = functools.lru_cache(packaging.utils.canonicalize_name)
+
+
 def field_to_metadata(field: str) -> frozenset[str]:
     """
     Return the METADATA fields that correspond to a project field.
     """
-    return frozenset(constants.PROJECT_TO_METADATA[field])
+    return constants.PROJECT_TO_METADATA[field]
 
 
 def extras_top_level(pyproject_table: Mapping[str, Any]) -> set[str]:
@@ -155,8 +165,7 @@ class _JSonMessageSetter:
             return
 
         if name == "keywords":
-            values = (x.strip() for x in value.split(","))
-            self.data[key] = [x for x in values if x]
+            self.data[key] = [x for x in map(str.strip, value.split(",")) if x]
         elif name in constants.KNOWN_MULTIUSE:
             entry = self.data.setdefault(key, [])
             assert isinstance(entry, list)
@@ -168,6 +177,46 @@ class _JSonMessageSetter:
         self["description"] = payload
 
 
+@dataclasses.dataclass
+class _RawMessageSetter:
+    """
+    This builds an RFC822 message directly as a string, skipping the
+    :mod:`email` machinery. The output matches :class:`RFC822Message`,
+    including the line ending normalization done by :mod:`email.generator`.
+
+    If a value is None, do nothing.
+    """
+
+    lines: list[str] = dataclasses.field(default_factory=list)
+    payload: str = ""
+
+    def __setitem__(self, name: str, value: str | None) -> None:
+        if not value:
+            return
+        folded = "\n".join(_fold_header(name, value).splitlines())
+        self.lines.append(f"{name}: {folded}\n")
+
+    def set_payload(self, payload: str) -> None:
+        self.payload = payload.replace("\r\n", "\n").replace("\r", "\n")
+
+    def as_bytes(self) -> bytes:
+        return f"{''.join(self.lines)}\n{self.payload}".encode()
+
+
+def _fold_header(name: str, value: str) -> str:
+    """
+    Check that a header is a known metadata field, and indent continuation
+    lines of multiline values to line up after the field name.
+    """
+    if name.lower() not in constants.KNOWN_METADATA_FIELDS:
+        msg = f"Unknown field {name!r}"
+        raise ConfigurationError(msg, key=name)
+    if "\n" not in value:
+        return value
+    size = len(name) + 2
+    return value.replace("\n", "\n" + " " * size)
+
+
 class RFC822Policy(email.policy.EmailPolicy):
     """
     This is :class:`email.policy.EmailPolicy`, but with a simple ``header_store_parse``
@@ -179,12 +228,7 @@ class RFC822Policy(email.policy.EmailPolicy):
     max_line_length = 0
 
     def header_store_parse(self, name: str, value: str) -> tuple[str, str]:
-        if name.lower() not in constants.KNOWN_METADATA_FIELDS:
-            msg = f"Unknown field {name!r}"
-            raise ConfigurationError(msg, key=name)
-        size = len(name) + 2
-        value = value.replace("\n", "\n" + " " * size)
-        return (name, value)
+        return (name, _fold_header(name, value))
 
 
 class RFC822Message(email.message.EmailMessage):
@@ -274,7 +318,7 @@ class StandardMetadata:
         """
         Return the canonical name of the project.
         """
-        return packaging.utils.canonicalize_name(self.name)
+        return _canonicalize_name(self.name)
 
     @classmethod
     def from_pyproject(  # noqa: C901
@@ -441,6 +485,16 @@ class StandardMetadata:
         self._write_metadata(smart_message)
         return message
 
+    def as_rfc822_bytes(self) -> bytes:
+        """
+        Return the RFC822 message with the metadata as UTF-8 encoded bytes. This
+        is the same as ``bytes(self.as_rfc822())``, but writes the message
+        directly instead of building an :class:`RFC822Message`.
+        """
+        smart_message = _RawMessageSetter()
+        self._write_metadata(smart_message)
+        return smart_message.as_bytes()
+
     def as_json(self) -> dict[str, str | list[str]]:
         """
         Return a JSON message with the metadata.
@@ -468,8 +522,14 @@ class StandardMetadata:
         - ``project_url`` can't contain keys over 32 characters
         """
         errors = ErrorCollector(collect_errors=self.all_errors)
+        metadata_version = self.auto_metadata_version
+        classic_license = isinstance(self.license, License)
+        spdx_license = isinstance(self.license, str)
+        has_license_classifier = any(
+            c.startswith("License ::") for c in self.classifiers
+        )
 
-        if self.auto_metadata_version not in constants.KNOWN_METADATA_VERSIONS:
+        if metadata_version not in constants.KNOWN_METADATA_VERSIONS:
             msg = "The metadata_version must be one of {versions} or None (default)"
             errors.config_error(msg, versions=constants.KNOWN_METADATA_VERSIONS)
 
@@ -482,13 +542,11 @@ class StandardMetadata:
             )
             errors.config_error(msg, key="project.name", name=self.name)
 
-        if self.license_files is not None and isinstance(self.license, License):
+        if self.license_files is not None and classic_license:
             msg = '{key} must not be used when "project.license" is not a SPDX license expression'
             errors.config_error(msg, key="project.license-files")
 
-        if isinstance(self.license, str) and any(
-            c.startswith("License ::") for c in self.classifiers
-        ):
+        if spdx_license and has_license_classifier:
             msg = "Setting {key} to an SPDX license expression is not compatible with 'License ::' classifiers"
             errors.config_error(msg, key="project.license")
 
@@ -499,30 +557,27 @@ class StandardMetadata:
                     ConfigurationWarning,
                     stacklevel=2,
                 )
-            if self.auto_metadata_version not in constants.PRE_SPDX_METADATA_VERSIONS:
-                if isinstance(self.license, License):
+            if metadata_version not in constants.PRE_SPDX_METADATA_VERSIONS:
+                if classic_license:
                     warnings.warn(
                         'Set "project.license" to an SPDX license expression for metadata >= 2.4',
                         ConfigurationWarning,
                         stacklevel=2,
                     )
-                elif any(c.startswith("License ::") for c in self.classifiers):
+                elif has_license_classifier:
                     warnings.warn(
                         "'License ::' classifiers are deprecated for metadata >= 2.4, use a SPDX license expression for \"project.license\" instead",
                         ConfigurationWarning,
                         stacklevel=2,
                     )
 
-        if (
-            isinstance(self.license, str)
-            and self.auto_metadata_version in constants.PRE_SPDX_METADATA_VERSIONS
-        ):
+        if spdx_license and metadata_version in constants.PRE_SPDX_METADATA_VERSIONS:
             msg = "Setting {key} to an SPDX license expression is supported only when emitting metadata version >= 2.4"
             errors.config_error(msg, key="project.license")
 
         if (
             self.license_files is not None
-            and self.auto_metadata_version in constants.PRE_SPDX_METADATA_VERSIONS
+            and metadata_version in constants.PRE_SPDX_METADATA_VERSIONS
         ):
             msg = "{key} is supported only when emitting metadata version >= 2.4"
             errors.config_error(msg, key="project.license-files")
@@ -535,16 +590,18 @@ class StandardMetadata:
         errors.finalize("Metadata validation failed")
 
     def _write_metadata(  # noqa: C901
-        self, smart_message: _SmartMessageSetter | _JSonMessageSetter
+        self,
+        smart_message: _SmartMessageSetter | _JSonMessageSetter | _RawMessageSetter,
     ) -> None:
         """
-        Write the metadata to the message. Handles JSON or Message.
+        Write the metadata to the message. Handles JSON, Message, or raw RFC822.
         """
         errors = ErrorCollector(collect_errors=self.all_errors)
         with errors.collect():
             self.validate(warn=False)
+        metadata_version = self.auto_metadata_version
 
-        smart_message["Metadata-Version"] = self.auto_metadata_version
+        smart_message["Metadata-Version"] = metadata_version
         smart_message["Name"] = self.name
         if not self.version:
             msg = "Field {key} missing"
@@ -554,13 +611,16 @@ class StandardMetadata:
         # skip 'Supported-Platform'
         if self.description:
             smart_message["Summary"] = self.description
-        smart_message["Keywords"] = ",".join(self.keywords) or None
+        if self.keywords:
+            smart_message["Keywords"] = ",".join(self.keywords) or None
         # skip 'Home-page'
         # skip 'Download-URL'
-        smart_message["Author"] = _name_list(self.authors)
-        smart_message["Author-Email"] = _email_list(self.authors)
-        smart_message["Maintainer"] = _name_list(self.maintainers)
-        smart_message["Maintainer-Email"] = _email_list(self.maintainers)
+        author, author_email = _split_people(self.authors)
+        smart_message["Author"] = author
+        smart_message["Author-Email"] = author_email
+        maintainer, maintainer_email = _split_people(self.maintainers)
+        smart_message["Maintainer"] = maintainer
+        smart_message["Maintainer-Email"] = maintainer_email
 
         if isinstance(self.license, License):
             smart_message["License"] = self.license.text
@@ -571,7 +631,7 @@ class StandardMetadata:
             for license_file in sorted(set(self.license_files)):
                 smart_message["License-File"] = os.fspath(license_file.as_posix())
         elif (
-            self.auto_metadata_version not in constants.PRE_SPDX_METADATA_VERSIONS
+            metadata_version not in constants.PRE_SPDX_METADATA_VERSIONS
             and isinstance(self.license, License)
             and self.license.file
         ):
@@ -589,18 +649,19 @@ class StandardMetadata:
         for dep in self.dependencies:
             smart_message["Requires-Dist"] = str(dep)
         for extra, requirements in self.optional_dependencies.items():
-            norm_extra = extra.replace(".", "-").replace("_", "-").lower()
+            norm_extra = extra.translate(_EXTRA_TRANSLATION).lower()
             smart_message["Provides-Extra"] = norm_extra
+            extra_marker = packaging.markers.Marker(f"extra == {norm_extra!r}")
             for requirement in requirements:
                 smart_message["Requires-Dist"] = str(
-                    _build_extra_req(norm_extra, requirement)
+                    _build_extra_req(extra_marker, requirement)
                 )
         if self.readme:
             if self.readme.content_type:
                 smart_message["Description-Content-Type"] = self.readme.content_type
             smart_message.set_payload(self.readme.text)
         # Core Metadata 2.2
-        if self.auto_metadata_version != "2.1":
+        if metadata_version != "2.1":
             for field in self.dynamic_metadata:
                 if field.lower() in {"name", "version", "dynamic"}:
                     msg = f"Metadata field {field!r} cannot be declared dynamic"
@@ -613,42 +674,71 @@ class StandardMetadata:
         errors.finalize("Failed to write metadata")
 
 
-def _name_list(people: list[tuple[str, str | None]]) -> str | None:
+def _split_people(
+    people: list[tuple[str, str | None]],
+) -> tuple[str | None, str | None]:
     """
-    Build a comma-separated list of names.
+    Build comma-separated lists of names (for people without an email) and of
+    emails, in a single pass.
     """
-    return ", ".join(name for name, email_ in people if not email_) or None
+    names = []
+    emails = []
+    for name, _email in people:
+        if _email:
+            emails.append(_format_address(name, _email))
+        else:
+            names.append(name)
+    return ", ".join(names) or None, ", ".join(emails) or None
 
 
-def _email_list(people: list[tuple[str, str | None]]) -> str | None:
+def _format_address(name: str, address: str) -> str:
     """
-    Build a comma-separated list of emails.
+    Format a name and email address pair. Plain ASCII names are formatted
+    directly; anything needing quoting or encoding uses
+    :func:`email.utils.formataddr`.
     """
-    return (
-        ", ".join(
-            email.utils.formataddr((name, _email)) for name, _email in people if _email
-        )
-        or None
-    )
+    if (
+        name
+        and name.isascii()
+        and address.isascii()
+        and _ADDRESS_SPECIALS.isdisjoint(name)
+    ):
+        return f"{name} <{address}>"
+    return email.utils.formataddr((name, address))
+
+
+def _copy_requirement(requirement: Requirement) -> Requirement:
+    """
+    Make a shallow copy of a requirement. This sets the attributes directly,
+    which is much faster than :func:`copy.copy`.
+    """
+    new_requirement = object.__new__(type(requirement))
+    new_requirement.name = requirement.name
+    new_requirement.url = requirement.url
+    new_requirement.extras = requirement.extras
+    new_requirement.specifier = requirement.specifier
+    new_requirement.marker = requirement.marker
+    return new_requirement
 
 
 def _build_extra_req(
-    extra: str,
+    extra_marker: packaging.markers.Marker,
     requirement: Requirement,
 ) -> Requirement:
     """
-    Build a new requirement with an extra marker.
+    Build a new requirement with an extra marker. The parsed marker of the
+    requirement is reused, so nothing needs to be parsed here.
     """
-    requirement = copy.copy(requirement)
+    requirement = _copy_requirement(requirement)
     if requirement.marker:
-        if "or" in requirement.marker._markers:
-            requirement.marker = packaging.markers.Marker(
-                f"({requirement.marker}) and extra == {extra!r}"
-            )
-        else:
-            requirement.marker = packaging.markers.Marker(
-                f"{requirement.marker} and extra == {extra!r}"
-            )
+        markers = requirement.marker._markers
+        # A marker that is one parenthesised group is written without them
+        while len(markers) == 1 and isinstance(markers[0], list):
+            markers = markers[0]
+        if "or" in markers:
+            markers = [markers]
+        requirement.marker = object.__new__(packaging.markers.Marker)
+        requirement.marker._markers = [*markers, "and", *extra_marker._markers]
     else:
-        requirement.marker = packaging.markers.Marker(f"extra == {extra!r}")
+        requirement.marker = extra_marker
     return requirement
@@ -60,6 +60,8 @@ class Readme:
 
 T = typing.TypeVar("T")
 
+_ENTRYPOINT_GROUP_RE = re.compile(r"^\w+(\.\w+)*$")
+
 
 @dataclasses.dataclass
 class PyProjectReader(ErrorCollector):
@@ -386,7 +388,7 @@ class PyProjectReader(ErrorCollector):
             return {}
         for section, entrypoints in val.items():
             assert isinstance(section, str)
-            if not re.match(r"^\w+(\.\w+)*$", section):
+            if not _ENTRYPOINT_GROUP_RE.match(section):
                 msg = (
                     "Field {key} has an invalid value, expecting a name "
                     "containing only alphanumeric, underscore, or dot characters"
@@ -141,6 +141,11 @@ def test_headers(
         (a, "\n       ".join(b.splitlines())) for a, b in items if b is not None
     ]
 
+    raw_message = pyproject_metadata._RawMessageSetter()
+    for name, value in items:
+        raw_message[name] = value
+    assert raw_message.as_bytes() == data.encode()
+
 
 def test_body(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
@@ -192,6 +197,11 @@ def test_unknown_field() -> None:
         match=re.escape("Unknown field 'Unknown'"),
     ):
         message["Unknown"] = "Value"
+    with pytest.raises(
+        pyproject_metadata.ConfigurationError,
+        match=re.escape("Unknown field 'Unknown'"),
+    ):
+        pyproject_metadata._RawMessageSetter()["Unknown"] = "Value"
 
 
 def test_known_field() -> None:
@@ -223,6 +233,29 @@ def test_convert_optional_dependencies() -> None:
     ]
 
 
+def test_convert_optional_dependencies_grouped() -> None:
+    metadata = pyproject_metadata.StandardMetadata.from_pyproject(
+        {
+            "project": {
+                "name": "example",
+                "version": "0.1.0",
+                "optional-dependencies": {
+                    "test": [
+                        'foo; (os_name == "nt" and sys_platform == "win32")',
+                        'bar; (os_name == "nt" or sys_platform == "win32")',
+                    ],
+                },
+            },
+        }
+    )
+    requires = [
+        'foo; os_name == "nt" and sys_platform == "win32" and extra == "test"',
+        'bar; (os_name == "nt" or sys_platform == "win32") and extra == "test"',
+    ]
+    assert metadata.as_rfc822().get_all("Requires-Dist") == requires
+    assert metadata.as_json()["requires_dist"] == requires
+
+
 def test_convert_author_email() -> None:
     metadata = pyproject_metadata.StandardMetadata.from_pyproject(
         {
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import contextlib
+import email.utils
 import pathlib
 import re
 import shutil
 import sys
 import textwrap
 import warnings
+import weakref
 
 import packaging.specifiers
 import packaging.version
@@ -1181,6 +1183,16 @@ def test_as_rfc822(monkeypatch: pytest.MonkeyPatch) -> None:
         ("Description-Content-Type", "text/markdown"),
     ]
     assert core_metadata.get_payload() == "some readme 👋\n"
+    assert metadata.as_rfc822_bytes() == bytes(core_metadata)
+
+    # The email generator normalizes line endings
+    metadata.description = "a\rb\r\n"
+    metadata.readme = pyproject_metadata.Readme(
+        "line1\r\nline2\rline3\n\r", None, "text/plain"
+    )
+    raw = metadata.as_rfc822_bytes()
+    assert raw == bytes(metadata.as_rfc822())
+    assert b"\r" not in raw
 
 
 def test_as_json_spdx(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -1221,6 +1233,21 @@ def test_as_rfc822_spdx(monkeypatch: pytest.MonkeyPatch) -> None:
     ]
 
     assert core_metadata.get_payload() is None
+    assert metadata.as_rfc822_bytes() == bytes(core_metadata)
+
+
+def test_license_files_normalized() -> None:
+    metadata = pyproject_metadata.StandardMetadata(
+        name="something",
+        version=packaging.version.Version("1.0.0"),
+        license="MIT",
+        license_files=[pathlib.Path("c.txt")],
+    )
+    metadata.license_files = [pathlib.Path("b.txt"), pathlib.Path("a.txt")]
+    metadata.license_files.append(pathlib.Path("b.txt"))
+    assert metadata.as_json()["license_file"] == ["a.txt", "b.txt"]
+    assert metadata.as_rfc822().get_all("License-File") == ["a.txt", "b.txt"]
+    assert metadata.as_rfc822_bytes() == bytes(metadata.as_rfc822())
 
 
 def test_as_rfc822_spdx_empty_glob(
@@ -1416,6 +1443,37 @@ def test_as_rfc822_mapped_dynamic() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("name", "address"),
+    [
+        pytest.param("John Doe", "john@example.com", id="plain"),
+        pytest.param("Doe, John", "john@example.com", id="comma"),
+        pytest.param("J. Doe", "john@example.com", id="dot"),
+        pytest.param('John "JD" Doe', "john@example.com", id="quote"),
+        pytest.param("John\\Doe", "john@example.com", id="backslash"),
+        pytest.param("John (JD) Doe", "john@example.com", id="parentheses"),
+        pytest.param("Jöhn Døe", "john@example.com", id="non-ascii name"),
+        pytest.param("", "john@example.com", id="empty name"),
+        pytest.param("John Doe", "jöhn@example.com", id="non-ascii address"),
+    ],
+)
+def test_format_address(name: str, address: str) -> None:
+    try:
+        expected = email.utils.formataddr((name, address))
+    except UnicodeEncodeError:
+        with pytest.raises(UnicodeEncodeError):
+            pyproject_metadata._format_address(name, address)
+    else:
+        assert pyproject_metadata._format_address(name, address) == expected
+
+
+def test_canonical_name_after_rename() -> None:
+    metadata = pyproject_metadata.StandardMetadata(name="Some_Thing")
+    assert metadata.canonical_name == "some-thing"
+    metadata.name = "Other.Thing"
+    assert metadata.canonical_name == "other-thing"
+
+
 def test_as_rfc822_missing_version() -> None:
     metadata = pyproject_metadata.StandardMetadata(name="something")
     with pytest.raises(
@@ -1424,6 +1482,12 @@ def test_as_rfc822_missing_version() -> None:
         metadata.as_rfc822()
 
 
+def test_not_slotted() -> None:
+    metadata = pyproject_metadata.StandardMetadata(name="something")
+    assert weakref.ref(metadata)() is metadata
+    metadata.extra_attribute = 1  # type: ignore[attr-defined]
+
+
 def test_statically_defined_dynamic_field() -> None:
     with pytest.raises(
         pyproject_metadata.ConfigurationError,